@@ -8,8 +8,12 @@ for extracurricular activities at Mergington High School.
 from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
+from pydantic import BaseModel
 import os
 from pathlib import Path
+from typing import List
+
+from src.seed_data import activities
 
 app = FastAPI(title="Mergington High School API",
               description="API for viewing and signing up for extracurricular activities")
@@ -19,66 +23,14 @@ current_dir = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
-# In-memory activity database
-activities = {
-    "Chess Club": {
-        "description": "Learn strategies and compete in chess tournaments",
-        "schedule": "Fridays, 3:30 PM - 5:00 PM",
-        "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-    },
-    "Programming Class": {
-        "description": "Learn programming fundamentals and build software projects",
-        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-        "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-    },
-    "Gym Class": {
-        "description": "Physical education and sports activities",
-        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-        "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-    },
-    # Sports related activities
-    "Soccer Team": {
-        "description": "Join the school soccer team and compete in matches",
-        "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
-        "max_participants": 18,
-        "participants": ["lucas@mergington.edu", "mia@mergington.edu"]
-    },
-    "Basketball Club": {
-        "description": "Practice basketball skills and play friendly games",
-        "schedule": "Thursdays, 3:30 PM - 5:00 PM",
-        "max_participants": 15,
-        "participants": ["liam@mergington.edu", "ava@mergington.edu"]
-    },
-    # Artistic activities
-    "Art Workshop": {
-        "description": "Explore painting, drawing, and sculpture techniques",
-        "schedule": "Mondays, 4:00 PM - 5:30 PM",
-        "max_participants": 16,
-        "participants": ["noah@mergington.edu", "isabella@mergington.edu"]
-    },
-    "Drama Club": {
-        "description": "Act, direct, and produce school plays and performances",
-        "schedule": "Fridays, 3:30 PM - 5:30 PM",
-        "max_participants": 20,
-        "participants": ["ethan@mergington.edu", "charlotte@mergington.edu"]
-    },
-    # Intellectual activities
-    "Mathletes": {
-        "description": "Compete in math competitions and solve challenging problems",
-        "schedule": "Tuesdays, 4:00 PM - 5:00 PM",
-        "max_participants": 10,
-        "participants": ["alex@mergington.edu", "grace@mergington.edu"]
-    },
-    "Science Club": {
-        "description": "Conduct experiments and explore scientific concepts",
-        "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-        "max_participants": 14,
-        "participants": ["ben@mergington.edu", "zoe@mergington.edu"]
-    }
-}
+
+class Signup(BaseModel):
+    activity: str
+    email: str
+
+
+class BatchSignupRequest(BaseModel):
+    signups: List[Signup]
 
 
 @app.get("/")
@@ -88,7 +40,10 @@ def root():
 
 @app.get("/activities")
 def get_activities():
-    return activities
+    return {
+        name: {**details, "participants": list(details["participants"])}
+        for name, details in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
@@ -106,10 +61,23 @@ def signup_for_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student already signed up for this activity")
     
     # Add student
-    activity["participants"].append(email)
+    activity["participants"][email] = None
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
+@app.post("/activities/signup:batch")
+def batch_signup(request: BatchSignupRequest):
+    """Sign up several students for activities in a single request"""
+    results = []
+    for signup in request.signups:
+        try:
+            result = signup_for_activity(signup.activity, signup.email)
+            results.append({"status_code": 200, **result})
+        except HTTPException as exc:
+            results.append({"status_code": exc.status_code, "detail": exc.detail})
+    return {"results": results}
+
+
 @app.delete("/activities/{activity_name}/participants/{email}")
 def remove_participant(activity_name: str, email: str):
     """Remove a participant from an activity"""
@@ -125,5 +93,5 @@ def remove_participant(activity_name: str, email: str):
         raise HTTPException(status_code=404, detail="Participant not found in this activity")
     
     # Remove participant
-    activity["participants"].remove(email)
+    del activity["participants"][email]
     return {"message": f"Removed {email} from {activity_name}"}
@@ -0,0 +1,68 @@
+"""
+Seed data for the High School Management System API
+
+Kept apart from app.py so the activities can be loaded without importing
+FastAPI, e.g. when tests are only being collected.
+"""
+
+# In-memory activity database
+# Participants are dict keys: O(1) membership checks while keeping signup order
+activities = {
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": dict.fromkeys(["michael@mergington.edu", "daniel@mergington.edu"])
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": dict.fromkeys(["emma@mergington.edu", "sophia@mergington.edu"])
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": dict.fromkeys(["john@mergington.edu", "olivia@mergington.edu"])
+    },
+    # Sports related activities
+    "Soccer Team": {
+        "description": "Join the school soccer team and compete in matches",
+        "schedule": "Wednesdays, 4:00 PM - 5:30 PM",
+        "max_participants": 18,
+        "participants": dict.fromkeys(["lucas@mergington.edu", "mia@mergington.edu"])
+    },
+    "Basketball Club": {
+        "description": "Practice basketball skills and play friendly games",
+        "schedule": "Thursdays, 3:30 PM - 5:00 PM",
+        "max_participants": 15,
+        "participants": dict.fromkeys(["liam@mergington.edu", "ava@mergington.edu"])
+    },
+    # Artistic activities
+    "Art Workshop": {
+        "description": "Explore painting, drawing, and sculpture techniques",
+        "schedule": "Mondays, 4:00 PM - 5:30 PM",
+        "max_participants": 16,
+        "participants": dict.fromkeys(["noah@mergington.edu", "isabella@mergington.edu"])
+    },
+    "Drama Club": {
+        "description": "Act, direct, and produce school plays and performances",
+        "schedule": "Fridays, 3:30 PM - 5:30 PM",
+        "max_participants": 20,
+        "participants": dict.fromkeys(["ethan@mergington.edu", "charlotte@mergington.edu"])
+    },
+    # Intellectual activities
+    "Mathletes": {
+        "description": "Compete in math competitions and solve challenging problems",
+        "schedule": "Tuesdays, 4:00 PM - 5:00 PM",
+        "max_participants": 10,
+        "participants": dict.fromkeys(["alex@mergington.edu", "grace@mergington.edu"])
+    },
+    "Science Club": {
+        "description": "Conduct experiments and explore scientific concepts",
+        "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 14,
+        "participants": dict.fromkeys(["ben@mergington.edu", "zoe@mergington.edu"])
+    }
+}
@@ -0,0 +1,91 @@
+"""
+Shared fixtures for the High School Management System API tests
+
+src.app is imported inside the fixtures rather than at module level, and
+the seed-data parametrization reads src.seed_data, so collecting tests
+does not import FastAPI.
+"""
+
+import pytest
+import pytest_asyncio
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize seeded_participant over every participant in the initial data"""
+    if "seeded_participant" in metafunc.fixturenames:
+        from src.seed_data import activities
+
+        metafunc.parametrize(
+            "seeded_participant",
+            [
+                (name, email)
+                for name, details in activities.items()
+                for email in details["participants"]
+            ],
+            ids=lambda param: f"{param[0]}-{param[1]}",
+        )
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Import the FastAPI app on first use"""
+    from src.app import app
+
+    return app
+
+
+@pytest.fixture(scope="session")
+def activities():
+    """Import the in-memory activity database on first use"""
+    from src.app import activities
+
+    return activities
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Create a single test client shared by the whole session"""
+    from fastapi.testclient import TestClient
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture
+async def async_client(app):
+    """Create an async client that talks to the app over ASGI"""
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="module")
+def activities_json(client):
+    """Fetch the /activities payload once for read-only checks"""
+    return client.get("/activities").json()
+
+
+@pytest.fixture(scope="session")
+def pristine_participants(activities):
+    """Snapshot the initial participants of every activity once per session as read-only tuples"""
+    return {name: tuple(details["participants"]) for name, details in activities.items()}
+
+
+@pytest.fixture(autouse=True)
+def reset_activities(activities, pristine_participants):
+    """Restore participants of the activities a test changed"""
+    yield
+
+    # Only participants are ever mutated, so restore them in place
+    for name, details in activities.items():
+        participants = details["participants"]
+        baseline = pristine_participants[name]
+        if len(participants) == len(baseline) and all(
+            email == original for email, original in zip(participants, baseline)
+        ):
+            continue
+        participants.clear()
+        for email in baseline:
+            participants[email] = None
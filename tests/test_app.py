@@ -2,36 +2,35 @@
 Tests for the High School Management System API
 """
 
+import asyncio
+from urllib.parse import quote, urlencode
+
 import pytest
-from fastapi.testclient import TestClient
-from src.app import app, activities
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+EXPECTED_ACTIVITIES = [
+    "Chess Club",
+    "Programming Class",
+    "Gym Class",
+    "Soccer Team",
+    "Basketball Club",
+    "Art Workshop",
+    "Drama Club",
+    "Mathletes",
+    "Science Club"
+]
 
+REQUIRED_FIELDS = ["description", "schedule", "max_participants", "participants"]
 
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities data before each test"""
-    # Store original state
-    original_activities = {
-        name: {
-            "description": details["description"],
-            "schedule": details["schedule"],
-            "max_participants": details["max_participants"],
-            "participants": details["participants"].copy()
-        }
-        for name, details in activities.items()
-    }
-    
-    yield
-    
-    # Restore original state after test
-    for name, details in original_activities.items():
-        activities[name]["participants"] = details["participants"].copy()
+MULTISPORT_EMAIL = "multisport@mergington.edu"
+
+MULTISPORT_ACTIVITIES = ["Chess Club", "Programming Class", "Art Workshop"]
+
+# Encoded once at import so the concurrent signup test only posts
+MULTISPORT_SIGNUP_URLS = [
+    f"/activities/{quote(name)}/signup?{urlencode({'email': MULTISPORT_EMAIL})}"
+    for name in MULTISPORT_ACTIVITIES
+]
 
 
 class TestRootEndpoint:
@@ -58,36 +57,16 @@ class TestGetActivities:
         data = response.json()
         assert isinstance(data, dict)
     
-    def test_get_activities_contains_expected_activities(self, client):
+    @pytest.mark.parametrize("activity_name", EXPECTED_ACTIVITIES)
+    def test_get_activities_contains_expected_activities(self, activities_json, activity_name):
         """Test that response contains expected activity names"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        expected_activities = [
-            "Chess Club",
-            "Programming Class",
-            "Gym Class",
-            "Soccer Team",
-            "Basketball Club",
-            "Art Workshop",
-            "Drama Club",
-            "Mathletes",
-            "Science Club"
-        ]
-        
-        for activity_name in expected_activities:
-            assert activity_name in data
+        assert activity_name in activities_json
     
-    def test_activity_has_required_fields(self, client):
-        """Test that each activity has all required fields"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        required_fields = ["description", "schedule", "max_participants", "participants"]
-        
-        for activity_name, activity_details in data.items():
-            for field in required_fields:
-                assert field in activity_details, f"{activity_name} missing {field}"
+    @pytest.mark.parametrize("field", REQUIRED_FIELDS)
+    def test_activity_has_required_fields(self, activities_json, field):
+        """Test that every returned activity has the required field"""
+        for activity_name, activity_details in activities_json.items():
+            assert field in activity_details, f"{activity_name} missing {field}"
     
     def test_participants_is_list(self, client):
         """Test that participants field is a list"""
@@ -96,56 +75,55 @@ class TestGetActivities:
         
         for activity_name, activity_details in data.items():
             assert isinstance(activity_details["participants"], list)
+    
+    def test_participants_stored_as_dict_keys(self, activities):
+        """Test that participants are kept as dict keys for O(1) membership checks"""
+        for activity_name, activity_details in activities.items():
+            assert isinstance(activity_details["participants"], dict)
+    
+    def test_participants_keep_signup_order(self, client):
+        """Test that participants are returned in the order they signed up"""
+        email = "ordertest@mergington.edu"
+        client.post(f"/activities/Chess Club/signup?email={email}")
+        
+        response = client.get("/activities")
+        assert response.json()["Chess Club"]["participants"] == [
+            "michael@mergington.edu",
+            "daniel@mergington.edu",
+            email
+        ]
 
 
 class TestSignupForActivity:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_new_participant_success(self, client):
-        """Test successfully signing up a new participant"""
-        response = client.post(
-            "/activities/Chess Club/signup?email=newstudent@mergington.edu"
-        )
-        assert response.status_code == 200
-        data = response.json()
-        assert "message" in data
-        assert "newstudent@mergington.edu" in data["message"]
-        assert "Chess Club" in data["message"]
+    @pytest.mark.parametrize(
+        "activity,email,expected_status,expected_text",
+        [
+            ("Chess Club", "newstudent@mergington.edu", 200,
+             "signed up newstudent@mergington.edu for chess club"),
+            ("Chess Club", "michael@mergington.edu", 400, "already signed up"),
+            ("Nonexistent Activity", "test@mergington.edu", 404, "not found"),
+        ],
+        ids=["new", "dup", "missing_activity"],
+    )
+    def test_signup_responses(self, client, activity, email, expected_status,
+                              expected_text):
+        """Test signup status codes and messages for new, duplicate and unknown cases"""
+        response = client.post(f"/activities/{activity}/signup?email={email}")
+        assert response.status_code == expected_status
+        assert expected_text in response.text.lower()
     
-    def test_signup_adds_participant_to_activity(self, client):
+    def test_signup_adds_participant_to_activity(self, client, activities):
         """Test that signup actually adds participant to the activity"""
         email = "teststudent@mergington.edu"
         
         # Sign up
-        client.post(f"/activities/Chess Club/signup?email={email}")
+        response = client.post(f"/activities/Chess Club/signup?email={email}")
+        assert response.json() == {"message": f"Signed up {email} for Chess Club"}
         
         # Verify participant was added
-        response = client.get("/activities")
-        data = response.json()
-        assert email in data["Chess Club"]["participants"]
-    
-    def test_signup_duplicate_participant_fails(self, client):
-        """Test that signing up an already registered participant fails"""
-        email = "duplicate@mergington.edu"
-        
-        # First signup should succeed
-        response1 = client.post(f"/activities/Chess Club/signup?email={email}")
-        assert response1.status_code == 200
-        
-        # Second signup should fail
-        response2 = client.post(f"/activities/Chess Club/signup?email={email}")
-        assert response2.status_code == 400
-        data = response2.json()
-        assert "already signed up" in data["detail"].lower()
-    
-    def test_signup_nonexistent_activity_fails(self, client):
-        """Test that signing up for a non-existent activity fails"""
-        response = client.post(
-            "/activities/Nonexistent Activity/signup?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
+        assert email in activities["Chess Club"]["participants"]
     
     def test_signup_requires_email_parameter(self, client):
         """Test that email parameter is required"""
@@ -153,23 +131,66 @@ class TestSignupForActivity:
         assert response.status_code == 422  # Unprocessable Entity
 
 
-class TestRemoveParticipant:
-    """Tests for DELETE /activities/{activity_name}/participants/{email} endpoint"""
+class TestBatchSignup:
+    """Tests for POST /activities/signup:batch endpoint"""
     
-    def test_remove_existing_participant_success(self, client):
-        """Test successfully removing an existing participant"""
-        # First, add a participant
-        email = "toremove@mergington.edu"
-        client.post(f"/activities/Chess Club/signup?email={email}")
+    @pytest.mark.parametrize("batch_size", [1, 10, 100])
+    def test_batch_signup(self, client, activities, batch_size):
+        """Test that a batch of new signups succeeds item by item"""
+        signups = [
+            {
+                "activity": EXPECTED_ACTIVITIES[i % len(EXPECTED_ACTIVITIES)],
+                "email": f"batch{i}@mergington.edu"
+            }
+            for i in range(batch_size)
+        ]
         
-        # Then remove them
-        response = client.delete(f"/activities/Chess Club/participants/{email}")
+        response = client.post("/activities/signup:batch", json={"signups": signups})
         assert response.status_code == 200
-        data = response.json()
-        assert "message" in data
-        assert email in data["message"]
+        results = response.json()["results"]
+        assert len(results) == batch_size
+        
+        for signup, result in zip(signups, results):
+            assert result["status_code"] == 200
+            assert signup["email"] in activities[signup["activity"]]["participants"]
     
-    def test_remove_participant_actually_removes(self, client):
+    def test_batch_signup_reports_per_item_status(self, client):
+        """Test that failing items are reported without aborting the batch"""
+        signups = [
+            {"activity": "Chess Club", "email": "batchnew@mergington.edu"},
+            {"activity": "Chess Club", "email": "michael@mergington.edu"},
+            {"activity": "Fake Activity", "email": "batchnew@mergington.edu"}
+        ]
+        
+        response = client.post("/activities/signup:batch", json={"signups": signups})
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [result["status_code"] for result in results] == [200, 400, 404]
+        assert "already signed up" in results[1]["detail"].lower()
+        assert "not found" in results[2]["detail"].lower()
+
+
+class TestRemoveParticipant:
+    """Tests for DELETE /activities/{activity_name}/participants/{email} endpoint"""
+    
+    @pytest.mark.parametrize(
+        "activity,email,expected_status,expected_text",
+        [
+            ("Chess Club", "daniel@mergington.edu", 200,
+             "removed daniel@mergington.edu from chess club"),
+            ("Chess Club", "notregistered@mergington.edu", 404, "not found"),
+            ("Fake Activity", "test@mergington.edu", 404, "not found"),
+        ],
+        ids=["existing", "missing_participant", "missing_activity"],
+    )
+    def test_remove_responses(self, client, activity, email, expected_status,
+                              expected_text):
+        """Test removal status codes and messages for existing and unknown cases"""
+        response = client.delete(f"/activities/{activity}/participants/{email}")
+        assert response.status_code == expected_status
+        assert expected_text in response.text.lower()
+    
+    def test_remove_participant_actually_removes(self, client, activities):
         """Test that remove actually removes the participant from the activity"""
         email = "toremove2@mergington.edu"
         
@@ -180,65 +201,32 @@ class TestRemoveParticipant:
         client.delete(f"/activities/Chess Club/participants/{email}")
         
         # Verify participant was removed
-        response = client.get("/activities")
-        data = response.json()
-        assert email not in data["Chess Club"]["participants"]
-    
-    def test_remove_nonexistent_participant_fails(self, client):
-        """Test that removing a non-existent participant fails"""
-        response = client.delete(
-            "/activities/Chess Club/participants/notregistered@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
-    
-    def test_remove_from_nonexistent_activity_fails(self, client):
-        """Test that removing from a non-existent activity fails"""
-        response = client.delete(
-            "/activities/Fake Activity/participants/test@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
+        assert email not in activities["Chess Club"]["participants"]
     
-    def test_remove_preexisting_participant(self, client):
+    def test_remove_preexisting_participant(self, client, activities, seeded_participant):
         """Test removing a participant that was already in the initial data"""
-        # Chess Club has michael@mergington.edu as a pre-existing participant
-        email = "michael@mergington.edu"
-        
-        # Verify they exist
-        response = client.get("/activities")
-        data = response.json()
-        assert email in data["Chess Club"]["participants"]
-        
-        # Remove them
-        response = client.delete(f"/activities/Chess Club/participants/{email}")
+        activity, email = seeded_participant
+        response = client.delete(f"/activities/{activity}/participants/{email}")
         assert response.status_code == 200
-        
-        # Verify they were removed
-        response = client.get("/activities")
-        data = response.json()
-        assert email not in data["Chess Club"]["participants"]
+        assert email not in activities[activity]["participants"]
 
 
 class TestEndToEndScenarios:
     """End-to-end test scenarios"""
     
-    def test_full_signup_and_removal_flow(self, client):
+    def test_full_signup_and_removal_flow(self, client, activities):
         """Test complete flow: get activities, signup, verify, remove, verify"""
         email = "flowtest@mergington.edu"
         activity = "Programming Class"
         
         # Get initial state
-        response = client.get("/activities")
-        initial_count = len(response.json()[activity]["participants"])
+        initial_count = len(activities[activity]["participants"])
         
         # Sign up
         response = client.post(f"/activities/{activity}/signup?email={email}")
         assert response.status_code == 200
         
-        # Verify signup
+        # Verify signup through the read endpoint
         response = client.get("/activities")
         data = response.json()
         assert email in data[activity]["participants"]
@@ -249,25 +237,22 @@ class TestEndToEndScenarios:
         assert response.status_code == 200
         
         # Verify removal
-        response = client.get("/activities")
-        data = response.json()
-        assert email not in data[activity]["participants"]
-        assert len(data[activity]["participants"]) == initial_count
+        assert email not in activities[activity]["participants"]
+        assert len(activities[activity]["participants"]) == initial_count
     
-    def test_multiple_signups_different_activities(self, client):
+    @pytest.mark.asyncio
+    async def test_multiple_signups_different_activities(self, async_client):
         """Test signing up the same email for multiple different activities"""
-        email = "multisport@mergington.edu"
-        
-        # Sign up for multiple activities
-        activities_to_join = ["Chess Club", "Programming Class", "Art Workshop"]
-        
-        for activity in activities_to_join:
-            response = client.post(f"/activities/{activity}/signup?email={email}")
+        # Sign up for multiple activities concurrently
+        responses = await asyncio.gather(*[
+            async_client.post(url) for url in MULTISPORT_SIGNUP_URLS
+        ])
+        for response in responses:
             assert response.status_code == 200
         
         # Verify all signups
-        response = client.get("/activities")
+        response = await async_client.get("/activities")
         data = response.json()
         
-        for activity in activities_to_join:
-            assert email in data[activity]["participants"]
+        for activity in MULTISPORT_ACTIVITIES:
+            assert MULTISPORT_EMAIL in data[activity]["participants"]